@@ -2,13 +2,14 @@
 Exam API Endpoints - Phase 2
 """
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import func
+from sqlalchemy.orm import Session, selectinload
 from typing import List, Dict, Any, Optional
 from pydantic import BaseModel
 
 from app.core.deps import get_current_user, get_db
 from app.models.user import User
-from app.models.exam import Exam, ExamAttempt, ExamResponse, ExamQuestion
+from app.models.exam import Exam, ExamAttempt, ExamResponse, ExamQuestion, ExamSection
 from app.services.exam_service import ExamService
 from app.services.grading_service import GradingService
 from datetime import datetime
@@ -125,7 +126,10 @@ async def get_exam_details(
 ):
     """Get detailed exam information"""
     
-    exam = db.query(Exam).filter(
+    # Load sections and their questions up front instead of one query per section
+    exam = db.query(Exam).options(
+        selectinload(Exam.sections).selectinload(ExamSection.questions)
+    ).filter(
         Exam.id == exam_id,
         Exam.is_active == True
     ).first()
@@ -205,12 +209,21 @@ async def start_exam(
             "message": "Resuming existing attempt"
         }
     
+    # Sum question points in the database instead of loading every section and question
+    max_points = db.query(
+        func.coalesce(func.sum(ExamQuestion.points), 0.0)
+    ).join(
+        ExamSection, ExamQuestion.section_id == ExamSection.id
+    ).filter(
+        ExamSection.exam_id == request.exam_id
+    ).scalar()
+    
     # Create new attempt
     attempt = ExamAttempt(
         exam_id=request.exam_id,
         user_id=current_user.id,
         status="in_progress",
-        max_points=sum(q.points for s in exam.sections for q in s.questions)
+        max_points=max_points
     )
     
     db.add(attempt)
@@ -328,12 +341,12 @@ async def complete_exam(
             detail="Exam attempt not found or already completed"
         )
     
-    # Calculate final score
-    responses = db.query(ExamResponse).filter(
+    # Calculate final score in the database rather than loading every response
+    total_points = db.query(
+        func.coalesce(func.sum(ExamResponse.points_earned), 0.0)
+    ).filter(
         ExamResponse.attempt_id == request.attempt_id
-    ).all()
-    
-    total_points = sum(response.points_earned for response in responses)
+    ).scalar()
     
     # Update attempt
     attempt.completed_at = datetime.utcnow()
@@ -4,7 +4,7 @@ SRS (Spaced Repetition System) API Endpoints - Phase 2
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from typing import List, Dict, Any, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from app.core.deps import get_current_user, get_db
 from app.models.user import User
@@ -19,6 +19,14 @@ class AddWordRequest(BaseModel):
     initial_quality: Optional[int] = 3
 
 
+# Upper bound on words per bulk add request
+MAX_BULK_ADD_WORDS = 200
+
+
+class AddWordsRequest(BaseModel):
+    lemma_ids: List[int] = Field(..., max_length=MAX_BULK_ADD_WORDS)
+
+
 class AddWordByLemmaRequest(BaseModel):
     lemma: str
     initial_quality: Optional[int] = 3
@@ -124,6 +132,28 @@ async def add_word_to_srs(
     return result
 
 
+@router.post("/add-words")
+async def add_words_to_srs(
+    request: AddWordsRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Add several words to SRS deck in one request
+    
+    Response: "added" lists the new cards ({card_id, lemma_id, lemma});
+    "reactivated", "already_exists" (card already active) and "not_found"
+    (no such word) list lemma ids.
+    """
+    
+    srs_service = SRSService()
+    
+    return srs_service.add_words_to_srs_bulk(
+        db=db,
+        user=current_user,
+        lemma_ids=request.lemma_ids
+    )
+
+
 @router.post("/add-word-by-lemma")
 async def add_word_to_srs_by_lemma(
     request: AddWordByLemmaRequest,
@@ -10,9 +10,12 @@ from app.schemas.translate import (
 from pydantic import BaseModel
 from app.services.cache_service import CacheService
 from app.services.openai_service import OpenAIService
+from app.services.enhanced_vocabulary_service import EnhancedVocabularyService
 
 router = APIRouter()
 openai_service = OpenAIService()
+# Shared across requests so its OpenAI clients reuse their connection pools
+vocabulary_service = EnhancedVocabularyService()
 
 
 class SelectSuggestionRequest(BaseModel):
@@ -53,8 +56,6 @@ async def translate_word(
             logging.debug("translate_word API called for query with special characters")
         
         # 使用增强词库服务
-        from app.services.enhanced_vocabulary_service import EnhancedVocabularyService
-        vocabulary_service = EnhancedVocabularyService()
         logging.debug("Using EnhancedVocabularyService")
         logging.debug(f"Service type: {type(vocabulary_service)}")
         
@@ -73,10 +74,7 @@ async def translate_word(
         logging.error("Word analysis failed: %s", str(e))
         raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
-        import traceback
-        error_trace = traceback.format_exc()
-        logging.error("Unexpected error analyzing word: %s", str(e))
-        logging.error("Full traceback: %s", error_trace)
+        logging.exception("Unexpected error analyzing word: %s", str(e))
         raise HTTPException(status_code=500, detail=f"Internal server error occurred during word analysis: {str(e)}")
 
 
@@ -96,9 +94,6 @@ async def translate_word_enhanced(
     
     try:
         # 使用增强词库服务
-        from app.services.enhanced_vocabulary_service import EnhancedVocabularyService
-        vocabulary_service = EnhancedVocabularyService()
-        
         result = await vocabulary_service.get_or_create_word_enhanced(
             db=db,
             lemma=query_text,
@@ -184,9 +179,6 @@ async def select_suggested_word(
     
     try:
         # 使用增强词库服务分析选中的词汇 - 保持与主搜索一致的格式
-        from app.services.enhanced_vocabulary_service import EnhancedVocabularyService
-        vocabulary_service = EnhancedVocabularyService()
-        
         result = await vocabulary_service.get_or_create_word_enhanced(
             db=db,
             lemma=selected_word,
@@ -215,7 +207,6 @@ async def select_word_choice(
     try:
         # Get the specific word by lemma_id and use Enhanced format for consistency
         from app.models.word import WordLemma
-        from app.services.enhanced_vocabulary_service import EnhancedVocabularyService
         from sqlalchemy.orm import joinedload
         
         # Load word with all relationships for proper formatting
@@ -230,7 +221,6 @@ async def select_word_choice(
             raise HTTPException(status_code=404, detail=f"Word with ID {request.lemma_id} not found")
         
         # Format the specific word using Enhanced format
-        vocabulary_service = EnhancedVocabularyService()
         result = await vocabulary_service.format_database_word_enhanced(
             word=word,
             original_query=request.original_query
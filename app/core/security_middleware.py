@@ -1,14 +1,25 @@
 """
 Security middleware for adding security headers and protection
 """
-from fastapi import Request, Response
+from fastapi import Request
 from fastapi.responses import JSONResponse
 import time
-from typing import Dict, Optional
+from typing import Dict
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Headers are constant, so build the table once instead of per response
+SECURITY_HEADERS = {
+    b"x-content-type-options": b"nosniff",
+    b"x-frame-options": b"DENY", 
+    b"x-xss-protection": b"1; mode=block",
+    b"strict-transport-security": b"max-age=31536000; includeSubDomains",
+    b"content-security-policy": b"default-src 'self'; script-src 'self' 'unsafe-inline'; style-src 'self' 'unsafe-inline'; img-src 'self' data: https:; connect-src 'self'",
+    b"referrer-policy": b"strict-origin-when-cross-origin",
+    b"permissions-policy": b"geolocation=(), microphone=(), camera=()"
+}
+
 class SecurityHeadersMiddleware:
     """Middleware to add security headers to all responses."""
     
@@ -24,19 +35,8 @@ class SecurityHeadersMiddleware:
             if message["type"] == "http.response.start":
                 headers = dict(message.get("headers", []))
                 
-                # Add security headers
-                security_headers = {
-                    b"x-content-type-options": b"nosniff",
-                    b"x-frame-options": b"DENY", 
-                    b"x-xss-protection": b"1; mode=block",
-                    b"strict-transport-security": b"max-age=31536000; includeSubDomains",
-                    b"content-security-policy": b"default-src 'self'; script-src 'self' 'unsafe-inline'; style-src 'self' 'unsafe-inline'; img-src 'self' data: https:; connect-src 'self'",
-                    b"referrer-policy": b"strict-origin-when-cross-origin",
-                    b"permissions-policy": b"geolocation=(), microphone=(), camera=()"
-                }
-                
                 # Add security headers to response
-                for key, value in security_headers.items():
+                for key, value in SECURITY_HEADERS.items():
                     if key not in headers:
                         headers[key] = value
                 
@@ -94,12 +94,13 @@ class RateLimitMiddleware:
             await self.app(scope, receive, send)
             return
         
-        request = Request(scope, receive)
-        client_ip = self._get_client_ip(request)
-        
         # Check auth endpoints more strictly 
         path = scope.get("path", "")
         if path.startswith("/auth/"):
+            # Only auth requests are counted, so resolve the client IP here
+            request = Request(scope, receive)
+            client_ip = self._get_client_ip(request)
+            
             # Stricter rate limiting for auth endpoints
             if self._is_rate_limited(client_ip):
                 response = JSONResponse(
@@ -218,13 +218,16 @@ async def seed_vocabulary_database():
     try:
         print("🌱 开始填充词库数据...")
         
+        # 一次查询找出已存在的词汇
+        existing_lemmas = {
+            lemma for (lemma,) in db.query(WordLemma.lemma).filter(
+                WordLemma.lemma.in_([word_data["lemma"] for word_data in SEED_VOCABULARY])
+            )
+        }
+        
+        new_words = []
         for word_data in SEED_VOCABULARY:
-            # 检查词汇是否已存在
-            existing = db.query(WordLemma).filter(
-                WordLemma.lemma == word_data["lemma"]
-            ).first()
-            
-            if existing:
+            if word_data["lemma"] in existing_lemmas:
                 print(f"⏩ 词汇 '{word_data['lemma']}' 已存在，跳过")
                 continue
             
@@ -237,48 +240,48 @@ async def seed_vocabulary_database():
                 frequency=word_data.get("frequency", 0),
                 notes=f"Seed data - {word_data['pos']}"
             )
-            
-            db.add(word)
-            db.commit()
-            db.refresh(word)
-            
+            new_words.append((word_data, word))
+        
+        # 一次flush为所有新词条分配ID，无需逐条commit/refresh
+        db.add_all([word for _, word in new_words])
+        db.flush()
+        
+        children = []
+        for word_data, word in new_words:
             # 添加翻译
             for lang, translations in [
                 ("en", word_data.get("translations_en", [])),
                 ("zh", word_data.get("translations_zh", []))
             ]:
                 for translation_text in translations:
-                    translation = Translation(
+                    children.append(Translation(
                         lemma_id=word.id,
                         lang_code=lang,
                         text=translation_text,
                         source="seed_data"
-                    )
-                    db.add(translation)
+                    ))
             
             # 添加例句
             example_data = word_data.get("example")
             if example_data:
-                example = Example(
+                children.append(Example(
                     lemma_id=word.id,
                     de_text=example_data.get("de", ""),
                     en_text=example_data.get("en", ""),
                     zh_text=example_data.get("zh", ""),
                     level=word_data.get("cefr", "A1")
-                )
-                db.add(example)
+                ))
             
             # 添加动词变位
             verb_forms = word_data.get("verb_forms", {})
             for tense, forms in verb_forms.items():
                 for person, form in forms.items():
-                    word_form = WordForm(
+                    children.append(WordForm(
                         lemma_id=word.id,
                         form=form,
                         feature_key="tense",
                         feature_value=f"{tense}_{person}"
-                    )
-                    db.add(word_form)
+                    ))
             
             # 添加名词信息（冠词、复数）
             if word_data["pos"] == "noun":
@@ -286,27 +289,29 @@ async def seed_vocabulary_database():
                 plural = word_data.get("plural")
                 
                 if article:
-                    article_form = WordForm(
+                    children.append(WordForm(
                         lemma_id=word.id,
                         form=f"{article} {word_data['lemma']}",
                         feature_key="article",
                         feature_value=article
-                    )
-                    db.add(article_form)
+                    ))
                 
                 if plural:
-                    plural_form = WordForm(
+                    children.append(WordForm(
                         lemma_id=word.id,
                         form=plural,
                         feature_key="number",
                         feature_value="plural"
-                    )
-                    db.add(plural_form)
-            
-            db.commit()
+                    ))
+        
+        db.add_all(children)
+        db.commit()
+        
+        # 提交成功后再输出，避免失败时日志误报已添加
+        for word_data, _ in new_words:
             print(f"✅ 添加词汇: {word_data['lemma']} ({word_data['pos']})")
         
-        print(f"🎉 词库初始化完成！总共添加了 {len(SEED_VOCABULARY)} 个词汇")
+        print(f"🎉 词库初始化完成！总共添加了 {len(new_words)} 个词汇")
         
         # 显示统计信息
         total_words = db.query(WordLemma).count()
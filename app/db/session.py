@@ -1,12 +1,17 @@
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from app.core.config import settings
 
+# In-memory SQLite only exists inside one connection, so all sessions must share it
+_in_memory_sqlite = settings.database_url in ("sqlite://", "sqlite:///:memory:")
+
 engine = create_engine(
     settings.database_url,
     echo=settings.debug,
     # SQLite specific settings
     connect_args={"check_same_thread": False} if "sqlite" in settings.database_url else {},
+    poolclass=StaticPool if _in_memory_sqlite else None,
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
\ No newline at end of file
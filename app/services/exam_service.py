@@ -479,28 +479,19 @@ Strict rules:
             created_by_id=user.id
         )
         
-        db.add(exam)
-        db.commit()
-        db.refresh(exam)
-        
-        # Create sections and questions
+        # Build sections and questions on the exam itself so the relationship
+        # cascade inserts the whole exam in a single flush and commit
         total_questions = 0
         for section_data in exam_content.get("sections", []):
             section = ExamSection(
-                exam_id=exam.id,
                 title=section_data.get("title", "Section"),
                 description=section_data.get("description", ""),
                 order_index=0
             )
             
-            db.add(section)
-            db.commit()
-            db.refresh(section)
-            
             # Create questions
-            for i, question_data in enumerate(section_data.get("questions", [])):
-                question = ExamQuestion(
-                    section_id=section.id,
+            section.questions = [
+                ExamQuestion(
                     question_type=question_data.get("type", "mcq"),
                     prompt=question_data.get("prompt", ""),
                     content=question_data.get("content", {}),
@@ -512,12 +503,13 @@ Strict rules:
                     order_index=i,
                     target_words=question_data.get("target_words", [])
                 )
-                
-                db.add(question)
-                total_questions += 1
+                for i, question_data in enumerate(section_data.get("questions", []))
+            ]
+            total_questions += len(section.questions)
+            exam.sections.append(section)
         
-        # Update exam total questions
         exam.total_questions = total_questions
+        db.add(exam)
         db.commit()
         
         return exam
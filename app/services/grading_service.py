@@ -10,6 +10,9 @@ from sqlalchemy.orm import Session
 from app.models.exam import ExamQuestion, ExamResponse, ExamAttempt
 from app.models.word import WordLemma, WordForm
 
+_WHITESPACE_RE = re.compile(r'\s+')
+_PUNCTUATION_RE = re.compile(r'[^\w\säöüß]')
+
 
 class GradingService:
     def __init__(self):
@@ -97,11 +100,10 @@ class GradingService:
             # Combine correct answers and alternatives
             all_acceptable = expected_answers + alternatives
             
-            # Check for exact match first
-            is_exact_match = any(
-                self._normalize_text(user_response) == self._normalize_text(ans)
-                for ans in all_acceptable
-            )
+            # Check for exact match first: normalize once, then a set lookup,
+            # so fuzzy matching only runs when this fails
+            acceptable_normalized = {self._normalize_text(ans) for ans in all_acceptable}
+            is_exact_match = self._normalize_text(user_response) in acceptable_normalized
             
             if is_exact_match:
                 correct_blanks += 1
@@ -349,10 +351,10 @@ class GradingService:
         text = text.lower().strip()
         
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = _WHITESPACE_RE.sub(' ', text)
         
         # Remove punctuation for comparison
-        text = re.sub(r'[^\w\säöüß]', '', text)
+        text = _PUNCTUATION_RE.sub('', text)
         
         # Normalize umlauts (optional - might not want this for German)
         # text = text.replace('ä', 'ae').replace('ö', 'oe').replace('ü', 'ue').replace('ß', 'ss')
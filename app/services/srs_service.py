@@ -2,7 +2,8 @@
 Spaced Repetition System (SRS) Service - Phase 2
 Implements simplified SM-2 algorithm for vocabulary learning
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
 import math
@@ -12,6 +13,13 @@ from app.models.word import WordLemma
 from app.models.user import User
 
 
+def _compute_accuracy(questions_answered: int, correct_answers: int) -> float:
+    """Accuracy percentage, 0.0 when nothing was answered; callers round for display"""
+    if not questions_answered:
+        return 0.0
+    return correct_answers / questions_answered * 100
+
+
 class SRSService:
     def __init__(self):
         # SM-2 algorithm constants
@@ -199,18 +207,100 @@ class SRSService:
         )
         
         db.add(card)
+        # Flush assigns the card id; build the result before commit expires
+        # the instance so no refresh round-trip is needed
+        db.flush()
+        result = {
+            "success": True,
+            "card_id": card.id,
+            "lemma": lemma.lemma,
+            "next_review": card.next_review_date.isoformat()
+        }
         db.commit()
-        db.refresh(card)
         
         # Update user progress
         self._update_user_progress(db, user)
         
-        return {
+        return result
+    
+    def add_words_to_srs_bulk(
+        self,
+        db: Session,
+        user: User,
+        lemma_ids: List[int]
+    ) -> Dict[str, Any]:
+        """Add several words to user's SRS deck with one lookup and one commit"""
+        
+        lemma_ids = list(dict.fromkeys(lemma_ids))
+        
+        # Existing cards for any of the requested words
+        existing_cards = {
+            card.lemma_id: card
+            for card in db.query(SRSCard).filter(
+                SRSCard.user_id == user.id,
+                SRSCard.lemma_id.in_(lemma_ids)
+            )
+        }
+        
+        # Verify the remaining lemmas exist
+        missing_ids = [lemma_id for lemma_id in lemma_ids if lemma_id not in existing_cards]
+        lemmas = {
+            lemma.id: lemma
+            for lemma in db.query(WordLemma).filter(WordLemma.id.in_(missing_ids))
+        } if missing_ids else {}
+        
+        reactivated = []
+        already_exists = []
+        not_found = []
+        new_cards = []
+        next_review_date = datetime.utcnow() + timedelta(days=1)
+        
+        for lemma_id in lemma_ids:
+            existing_card = existing_cards.get(lemma_id)
+            if existing_card:
+                if not existing_card.is_active:
+                    existing_card.is_active = True
+                    reactivated.append(lemma_id)
+                else:
+                    already_exists.append(lemma_id)
+                continue
+            
+            if lemma_id not in lemmas:
+                not_found.append(lemma_id)
+                continue
+            
+            new_cards.append(SRSCard(
+                user_id=user.id,
+                lemma_id=lemma_id,
+                ease_factor=self.initial_ease_factor,
+                interval_days=1,
+                repetition_count=0,
+                next_review_date=next_review_date,
+                is_active=True,
+                is_mature=False
+            ))
+        
+        db.add_all(new_cards)
+        # Flush assigns the card ids; build the result before commit expires
+        # the instances so no per-card reload is needed
+        db.flush()
+        result = {
             "success": True,
-            "card_id": card.id,
-            "lemma": lemma.lemma,
-            "next_review": card.next_review_date.isoformat()
+            "added": [
+                {"card_id": card.id, "lemma_id": card.lemma_id, "lemma": lemmas[card.lemma_id].lemma}
+                for card in new_cards
+            ],
+            "reactivated": reactivated,
+            "already_exists": already_exists,
+            "not_found": not_found
         }
+        db.commit()
+        
+        # Update user progress
+        if new_cards or reactivated:
+            self._update_user_progress(db, user)
+        
+        return result
     
     def get_srs_stats(self, db: Session, user: User) -> Dict[str, Any]:
         """Get user's SRS statistics"""
@@ -249,17 +339,8 @@ class SRSService:
         ).count()
         
         # Calculate accuracy
-        cards_with_reviews = db.query(SRSCard).filter(
-            SRSCard.user_id == user.id,
-            SRSCard.correct_count + SRSCard.incorrect_count > 0
-        ).all()
-        
-        if cards_with_reviews:
-            total_reviews = sum(card.correct_count + card.incorrect_count for card in cards_with_reviews)
-            total_correct = sum(card.correct_count for card in cards_with_reviews)
-            accuracy = (total_correct / total_reviews * 100) if total_reviews > 0 else 0
-        else:
-            accuracy = 0
+        total_reviews, total_correct = self._get_review_totals(db, user)
+        accuracy = _compute_accuracy(total_reviews, total_correct)
         
         return {
             "total_cards": total_cards,
@@ -271,6 +352,18 @@ class SRSService:
             "next_review_in_minutes": self._get_next_review_time(db, user)
         }
     
+    def _get_review_totals(self, db: Session, user: User) -> Tuple[int, int]:
+        """Get (total reviews, correct reviews) across the user's cards in one query"""
+        
+        total_reviews, total_correct = db.query(
+            func.coalesce(func.sum(SRSCard.correct_count + SRSCard.incorrect_count), 0),
+            func.coalesce(func.sum(SRSCard.correct_count), 0)
+        ).filter(
+            SRSCard.user_id == user.id
+        ).one()
+        
+        return int(total_reviews), int(total_correct)
+    
     def _get_next_review_time(self, db: Session, user: User) -> Optional[int]:
         """Get minutes until next review"""
         
@@ -314,15 +407,9 @@ class SRSService:
         ).count()
         
         # Calculate average accuracy
-        cards_with_reviews = db.query(SRSCard).filter(
-            SRSCard.user_id == user.id,
-            SRSCard.correct_count + SRSCard.incorrect_count > 0
-        ).all()
-        
-        if cards_with_reviews:
-            total_reviews = sum(card.correct_count + card.incorrect_count for card in cards_with_reviews)
-            total_correct = sum(card.correct_count for card in cards_with_reviews)
-            progress.average_accuracy = (total_correct / total_reviews) if total_reviews > 0 else 0
+        total_reviews, total_correct = self._get_review_totals(db, user)
+        if total_reviews > 0:
+            progress.average_accuracy = total_correct / total_reviews
         
         db.commit()
     
@@ -341,14 +428,15 @@ class SRSService:
         )
         
         db.add(session)
-        db.commit()
-        db.refresh(session)
-        
-        return {
+        db.flush()
+        result = {
             "session_id": session.id,
             "started_at": session.started_at.isoformat(),
             "type": session_type
         }
+        db.commit()
+        
+        return result
     
     def end_learning_session(
         self,
@@ -374,7 +462,7 @@ class SRSService:
         session.duration_seconds = int((now - session.started_at).total_seconds())
         session.questions_answered = questions_answered
         session.correct_answers = correct_answers
-        session.accuracy_percentage = (correct_answers / questions_answered * 100) if questions_answered > 0 else 0
+        session.accuracy_percentage = _compute_accuracy(questions_answered, correct_answers)
         session.topics_covered = topics_covered or []
         session.words_practiced = words_practiced or []
         
@@ -383,6 +471,6 @@ class SRSService:
         return {
             "success": True,
             "duration_minutes": round(session.duration_seconds / 60, 1),
-            "accuracy": session.accuracy_percentage,
+            "accuracy": round(session.accuracy_percentage, 1),
             "questions_answered": questions_answered
         }
\ No newline at end of file
@@ -120,8 +120,8 @@ def check_api_response_format():
     try:
         cursor.execute("""
             SELECT wl.lemma, wl.pos,
-                   GROUP_CONCAT(CASE WHEN t.lang_code = 'en' THEN t.text END) as translations_en,
-                   GROUP_CONCAT(CASE WHEN t.lang_code = 'zh' THEN t.text END) as translations_zh,
+                   GROUP_CONCAT(DISTINCT CASE WHEN t.lang_code = 'en' THEN t.text END) as translations_en,
+                   GROUP_CONCAT(DISTINCT CASE WHEN t.lang_code = 'zh' THEN t.text END) as translations_zh,
                    e.de_text, e.en_text, e.zh_text
             FROM word_lemmas wl
             LEFT JOIN translations t ON t.lemma_id = wl.id
@@ -20,20 +20,28 @@ def verify_translation_fixes():
         print("📊 1. 问题词汇修复验证:")
         problem_words = ['kreuzen', 'bezahlen', 'sehen', 'arbeiten', 'Haus']
         
+        # 一次查询取出所有问题词汇的统计，而不是每个词查询一次
+        placeholders = ",".join("?" * len(problem_words))
+        cursor.execute(f"""
+            SELECT LOWER(wl.lemma) as lemma_key, wl.lemma, wl.pos,
+                   COUNT(CASE WHEN t.lang_code = 'en' THEN 1 END) as en_count,
+                   COUNT(CASE WHEN t.lang_code = 'zh' THEN 1 END) as zh_count,
+                   MAX(CASE WHEN t.lang_code = 'en' THEN t.text END) as en_sample,
+                   MAX(CASE WHEN t.lang_code = 'zh' THEN t.text END) as zh_sample
+            FROM word_lemmas wl
+            LEFT JOIN translations t ON t.lemma_id = wl.id
+            WHERE LOWER(wl.lemma) IN ({placeholders})
+            GROUP BY wl.id
+            ORDER BY wl.id
+        """, [word.lower() for word in problem_words])
+        
+        # 每个词只显示第一条匹配记录
+        results = {}
+        for lemma_key, *row in cursor.fetchall():
+            results.setdefault(lemma_key, row)
+        
         for word in problem_words:
-            cursor.execute("""
-                SELECT wl.lemma, wl.pos,
-                       COUNT(CASE WHEN t.lang_code = 'en' THEN 1 END) as en_count,
-                       COUNT(CASE WHEN t.lang_code = 'zh' THEN 1 END) as zh_count,
-                       MAX(CASE WHEN t.lang_code = 'en' THEN t.text END) as en_sample,
-                       MAX(CASE WHEN t.lang_code = 'zh' THEN t.text END) as zh_sample
-                FROM word_lemmas wl
-                LEFT JOIN translations t ON t.lemma_id = wl.id
-                WHERE LOWER(wl.lemma) = LOWER(?)
-                GROUP BY wl.id
-            """, (word,))
-            
-            result = cursor.fetchone()
+            result = results.get(word.lower())
             if result:
                 lemma, pos, en_count, zh_count, en_sample, zh_sample = result
                 status = "✅" if (en_count > 0 and zh_count > 0) else "❌"
@@ -9,6 +9,8 @@ from datetime import datetime
 class ManualExampleAdder:
     def __init__(self):
         self.db_path = 'data/app.db'
+        # 整个运行过程复用同一个连接
+        self.conn = sqlite3.connect(self.db_path)
         self.stats = {
             'examples_added': 0,
             'errors': 0,
@@ -149,59 +151,37 @@ class ManualExampleAdder:
             }
         }
     
-    def add_example_for_word(self, lemma, example_data):
-        """为指定词汇添加例句"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+    def build_example_row(self, cursor, lemma, example_data):
+        """检查指定词汇，返回待插入的例句行"""
+        # 首先获取词汇ID
+        cursor.execute("SELECT id FROM word_lemmas WHERE lemma = ?", (lemma,))
+        result = cursor.fetchone()
         
-        try:
-            # 首先获取词汇ID
-            cursor.execute("SELECT id FROM word_lemmas WHERE lemma = ?", (lemma,))
-            result = cursor.fetchone()
-            
-            if not result:
-                print(f"   ❌ 词汇 {lemma} 不存在于数据库中")
-                return False
-            
-            lemma_id = result[0]
-            
-            # 检查是否已有例句
-            cursor.execute("SELECT COUNT(*) FROM examples WHERE lemma_id = ?", (lemma_id,))
-            existing_count = cursor.fetchone()[0]
-            
-            if existing_count > 0:
-                print(f"   ℹ️  {lemma} 已有 {existing_count} 个例句，跳过")
-                return False
-            
-            # 添加例句
-            cursor.execute("""
-                INSERT INTO examples (lemma_id, de_text, en_text, zh_text)
-                VALUES (?, ?, ?, ?)
-            """, (
-                lemma_id,
-                example_data['de'],
-                example_data['en'],
-                example_data['zh']
-            ))
-            
-            conn.commit()
-            self.stats['examples_added'] += 1
-            
-            print(f"   ✅ {lemma} 例句添加成功")
-            print(f"      DE: {example_data['de']}")
-            print(f"      EN: {example_data['en']}")
-            print(f"      ZH: {example_data['zh']}")
-            
-            return True
-            
-        except Exception as e:
-            print(f"   ❌ 添加 {lemma} 例句时出错: {e}")
-            self.stats['errors'] += 1
-            conn.rollback()
-            return False
-            
-        finally:
-            conn.close()
+        if not result:
+            print(f"   ❌ 词汇 {lemma} 不存在于数据库中")
+            return None
+        
+        lemma_id = result[0]
+        
+        # 检查是否已有例句
+        cursor.execute("SELECT COUNT(*) FROM examples WHERE lemma_id = ?", (lemma_id,))
+        existing_count = cursor.fetchone()[0]
+        
+        if existing_count > 0:
+            print(f"   ℹ️  {lemma} 已有 {existing_count} 个例句，跳过")
+            return None
+        
+        print(f"   📝 {lemma} 例句待添加")
+        print(f"      DE: {example_data['de']}")
+        print(f"      EN: {example_data['en']}")
+        print(f"      ZH: {example_data['zh']}")
+        
+        return (
+            lemma_id,
+            example_data['de'],
+            example_data['en'],
+            example_data['zh']
+        )
     
     def add_all_examples(self):
         """添加所有预定义的例句"""
@@ -213,10 +193,35 @@ class ManualExampleAdder:
             print(f"   • {lemma}")
         print()
         
-        for i, (lemma, example_data) in enumerate(self.examples.items(), 1):
-            print(f"[{i}/{len(self.examples)}] 处理: {lemma}")
-            self.add_example_for_word(lemma, example_data)
+        cursor = self.conn.cursor()
+        
+        try:
+            rows = []
+            for i, (lemma, example_data) in enumerate(self.examples.items(), 1):
+                print(f"[{i}/{len(self.examples)}] 处理: {lemma}")
+                row = self.build_example_row(cursor, lemma, example_data)
+                if row:
+                    rows.append(row)
+                print()
+            
+            # 所有例句一次性批量插入，整个运行只提交一次
+            cursor.executemany("""
+                INSERT INTO examples (lemma_id, de_text, en_text, zh_text)
+                VALUES (?, ?, ?, ?)
+            """, rows)
+            self.conn.commit()
+            self.stats['examples_added'] += len(rows)
+            
+            print(f"✅ {len(rows)} 个例句添加成功")
             print()
+            
+        except Exception as e:
+            print(f"❌ 添加例句时出错: {e}")
+            self.stats['errors'] += 1
+            self.conn.rollback()
+            
+        finally:
+            cursor.close()
         
         self.print_final_stats()
     
@@ -231,8 +236,7 @@ class ManualExampleAdder:
         print(f"总用时: {elapsed}")
         
         # 特别检查bezahlen
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self.conn.cursor()
         try:
             cursor.execute("""
                 SELECT e.de_text FROM examples e
@@ -249,15 +253,14 @@ class ManualExampleAdder:
                 print(f"\n⚠️  bezahlen仍然没有例句，请检查数据库")
                 
         finally:
-            conn.close()
+            cursor.close()
     
     def check_current_examples_status(self):
         """检查当前例句状态"""
         print("🔍 检查当前例句状态")
         print("=" * 30)
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self.conn.cursor()
         
         try:
             for lemma in ['bezahlen', 'kreuzen', 'arbeiten', 'leben']:
@@ -272,7 +275,11 @@ class ManualExampleAdder:
                 print(f"   {status} {lemma}: {count} 个例句")
                 
         finally:
-            conn.close()
+            cursor.close()
+
+    def close(self):
+        """关闭数据库连接"""
+        self.conn.close()
 
 def main():
     print("📚 手动例句添加器")
@@ -280,12 +287,15 @@ def main():
     
     adder = ManualExampleAdder()
     
-    # 检查当前状态
-    adder.check_current_examples_status()
-    print()
-    
-    # 添加例句
-    adder.add_all_examples()
+    try:
+        # 检查当前状态
+        adder.check_current_examples_status()
+        print()
+        
+        # 添加例句
+        adder.add_all_examples()
+    finally:
+        adder.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
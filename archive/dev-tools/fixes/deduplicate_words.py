@@ -86,11 +86,19 @@ class WordDeduplicator:
             ORDER BY count DESC
         ''')).fetchall()
         
+        if not duplicate_lemmas:
+            return duplicates
+        
+        # Load the words of every group in one query instead of one per group
+        lemma_lower_col = func.lower(WordLemma.lemma)
+        words_by_lemma = {}
+        for word, lemma_lower in self.db.query(WordLemma, lemma_lower_col).filter(
+            lemma_lower_col.in_([lemma_lower for lemma_lower, _ in duplicate_lemmas])
+        ).order_by(WordLemma.id):
+            words_by_lemma.setdefault(lemma_lower, []).append(word)
+        
         for lemma_lower, count in duplicate_lemmas:
-            # Get all words with this lemma
-            words = self.db.query(WordLemma).filter(
-                func.lower(WordLemma.lemma) == lemma_lower
-            ).all()
+            words = words_by_lemma.get(lemma_lower, [])
             
             if len(words) > 1:
                 duplicates[lemma_lower] = words
@@ -232,63 +240,77 @@ class WordDeduplicator:
         print(f"  🔄 Merging {len(words)} duplicates of '{best_word.lemma}'...")
         print(f"    Keeping: ID {best_word.id} (chosen as best)")
         
+        # Load the kept word's existing keys once, so each candidate row is a
+        # set lookup instead of its own existence query. Keys with a NULL part
+        # never match in SQL, so they are left out here as well.
+        existing_translations = {
+            tuple(key) for key in self.db.query(
+                Translation.lang_code, func.lower(Translation.text)
+            ).filter(Translation.lemma_id == best_word.id)
+            if None not in key
+        }
+        existing_examples = {
+            de_lower for (de_lower,) in self.db.query(
+                func.lower(Example.de_text)
+            ).filter(Example.lemma_id == best_word.id)
+            if de_lower is not None
+        }
+        existing_forms = {
+            tuple(key) for key in self.db.query(
+                func.lower(WordForm.form), WordForm.feature_key, WordForm.feature_value
+            ).filter(WordForm.lemma_id == best_word.id)
+            if None not in key
+        }
+        
         # Merge data from other words
         for word_to_delete in words_to_delete:
             print(f"    Deleting: ID {word_to_delete.id}")
             
             # Move translations
-            translations = self.db.query(Translation).filter(
+            translations = self.db.query(Translation, func.lower(Translation.text)).filter(
                 Translation.lemma_id == word_to_delete.id
             ).all()
             
-            for translation in translations:
+            for translation, text_lower in translations:
                 # Check if this translation already exists for the best word
-                existing = self.db.query(Translation).filter(
-                    Translation.lemma_id == best_word.id,
-                    Translation.lang_code == translation.lang_code,
-                    func.lower(Translation.text) == func.lower(translation.text)
-                ).first()
+                key = (translation.lang_code, text_lower)
                 
-                if not existing:
+                if key not in existing_translations:
                     translation.lemma_id = best_word.id
+                    if None not in key:
+                        existing_translations.add(key)
                     print(f"      Moved translation: {translation.text}")
                 else:
                     print(f"      Skipped duplicate translation: {translation.text}")
             
             # Move examples
-            examples = self.db.query(Example).filter(
+            examples = self.db.query(Example, func.lower(Example.de_text)).filter(
                 Example.lemma_id == word_to_delete.id
             ).all()
             
-            for example in examples:
+            for example, de_lower in examples:
                 # Check if similar example exists
-                existing = self.db.query(Example).filter(
-                    Example.lemma_id == best_word.id,
-                    func.lower(Example.de_text) == func.lower(example.de_text)
-                ).first()
-                
-                if not existing:
+                if de_lower not in existing_examples:
                     example.lemma_id = best_word.id
+                    if de_lower is not None:
+                        existing_examples.add(de_lower)
                     print(f"      Moved example: {example.de_text[:30]}...")
                 else:
                     print(f"      Skipped duplicate example: {example.de_text[:30]}...")
             
             # Move word forms
-            word_forms = self.db.query(WordForm).filter(
+            word_forms = self.db.query(WordForm, func.lower(WordForm.form)).filter(
                 WordForm.lemma_id == word_to_delete.id
             ).all()
             
-            for form in word_forms:
+            for form, form_lower in word_forms:
                 # Check if this form already exists
-                existing = self.db.query(WordForm).filter(
-                    WordForm.lemma_id == best_word.id,
-                    func.lower(WordForm.form) == func.lower(form.form),
-                    WordForm.feature_key == form.feature_key,
-                    WordForm.feature_value == form.feature_value
-                ).first()
+                key = (form_lower, form.feature_key, form.feature_value)
                 
-                if not existing:
+                if key not in existing_forms:
                     form.lemma_id = best_word.id
+                    if None not in key:
+                        existing_forms.add(key)
                     print(f"      Moved word form: {form.form}")
                 else:
                     print(f"      Skipped duplicate form: {form.form}")
@@ -314,26 +336,23 @@ class WordDeduplicator:
         
         scored_words = []
         
+        # Count related rows for the whole group at once, one query per table
+        word_ids = [word.id for word in words]
+        translation_counts = self.count_by_lemma(Translation, word_ids)
+        example_counts = self.count_by_lemma(Example, word_ids)
+        form_counts = self.count_by_lemma(WordForm, word_ids)
+        
         for word in words:
             score = 0
             
             # Count translations
-            translation_count = self.db.query(Translation).filter(
-                Translation.lemma_id == word.id
-            ).count()
-            score += translation_count * 10
+            score += translation_counts.get(word.id, 0) * 10
             
             # Count examples
-            example_count = self.db.query(Example).filter(
-                Example.lemma_id == word.id
-            ).count()
-            score += example_count * 5
+            score += example_counts.get(word.id, 0) * 5
             
             # Count word forms
-            form_count = self.db.query(WordForm).filter(
-                WordForm.lemma_id == word.id
-            ).count()
-            score += form_count * 2
+            score += form_counts.get(word.id, 0) * 2
             
             # Prefer non-fallback sources
             if word.notes and 'fallback' not in word.notes.lower():
@@ -360,6 +379,12 @@ class WordDeduplicator:
         
         return best_word
     
+    def count_by_lemma(self, model, lemma_ids: List[int]) -> Dict[int, int]:
+        """Count rows of a lemma-owned table for each of the given lemma ids"""
+        return dict(self.db.query(model.lemma_id, func.count(model.id)).filter(
+            model.lemma_id.in_(lemma_ids)
+        ).group_by(model.lemma_id).all())
+    
     def fix_duplicates(self, exact_duplicates: Dict[str, List[WordLemma]], 
                       similar_pairs: List[Tuple[WordLemma, WordLemma, float]],
                       auto_merge_exact: bool = True,
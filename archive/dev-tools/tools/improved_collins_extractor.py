@@ -5,12 +5,16 @@ Based on collins_reading_guide.md - extracts proper grammatical information
 Keeps it simple but accurate for UI compatibility
 """
 import asyncio
+import hashlib
 import sys
 import os
 import json
 import sqlite3
+import string
+import time
 from datetime import datetime
-from typing import List, Dict, Any
+from itertools import islice
+from typing import List, Dict, Any, Iterator, Optional
 from dotenv import load_dotenv
 
 load_dotenv(".env")
@@ -18,13 +22,142 @@ sys.path.append(os.getcwd())
 
 from app.services.openai_service import OpenAIService
 
+# Upper bound on simultaneous OpenAI calls
+MAX_CONCURRENT_REQUESTS = 4
+# Request budget shared by every OpenAI call in a run
+REQUESTS_PER_MINUTE = 60
+# SDK retries (exponential backoff with jitter) on 429/5xx and connection errors
+MAX_RETRIES = 6
+# Bound-parameter count per lemma lookup (SQLite caps older builds at 999)
+LOOKUP_BATCH_SIZE = 500
+
+# SQLite's LOWER() only folds ASCII, so lemma keys are folded the same way
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+# Deletes the [ ] around Collins IPA in one pass
+_BRACKET_TRANS = str.maketrans('', '', '[]')
+
+
+# Preferred chunk boundaries, strongest first: blank line, line, sentence, word
+CHUNK_SEPARATORS = ("\n\n", "\n", ". ", " ")
+
+
+def _find_chunk_boundary(text: str, chunk_size: int) -> int:
+    """Return where to cut text so the chunk ends on the strongest separator available"""
+    window = text[:chunk_size]
+    for separator in CHUNK_SEPARATORS:
+        idx = window.rfind(separator)
+        # Skip boundaries so early that they would leave a tiny chunk
+        if idx >= chunk_size // 2:
+            return idx + len(separator)
+    return chunk_size
+
+
+def iter_text_chunks(path: str, chunk_size: int) -> Iterator[str]:
+    """Yield the file's text in chunks of at most chunk_size, cut on entry boundaries"""
+    with open(path, 'r', encoding='utf-8') as f:
+        buffer = ''
+        for block in iter(lambda: f.read(chunk_size), ''):
+            buffer += block
+            while len(buffer) > chunk_size:
+                cut = _find_chunk_boundary(buffer, chunk_size)
+                yield buffer[:cut]
+                buffer = buffer[cut:]
+        if buffer:
+            yield buffer
+
+
+class ResponseCache:
+    """On-disk cache of OpenAI response bodies, keyed by a hash of the request"""
+    
+    def __init__(self, path: str):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, content TEXT NOT NULL)"
+        )
+    
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        return hashlib.sha256(json.dumps(parts, ensure_ascii=False).encode('utf-8')).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        row = self.conn.execute("SELECT content FROM responses WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+    
+    def set(self, key: str, content: str):
+        self.conn.execute("INSERT OR REPLACE INTO responses (key, content) VALUES (?, ?)", (key, content))
+        self.conn.commit()
+
+
+class RequestRateLimiter:
+    """Token bucket that paces requests to a requests-per-minute budget"""
+    
+    def __init__(self, requests_per_minute: int):
+        self.capacity = float(requests_per_minute)
+        self.tokens = self.capacity
+        self.refill_per_second = requests_per_minute / 60.0
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Wait until a request slot is available, then take it"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity,
+                    self.tokens + (now - self.updated_at) * self.refill_per_second
+                )
+                self.updated_at = now
+                
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                
+                await asyncio.sleep((1 - self.tokens) / self.refill_per_second)
+
 
 class ImprovedCollinsExtractor:
     """Improved Collins extractor following guide principles"""
     
     def __init__(self):
         self.openai_service = OpenAIService()
+        # A long batch run should ride out transient failures rather than drop chunks
+        self.client = (
+            self.openai_service.client.with_options(max_retries=MAX_RETRIES)
+            if self.openai_service.client else None
+        )
         self.db_path = 'data/app.db'
+        self.rate_limiter = RequestRateLimiter(REQUESTS_PER_MINUTE)
+        # Re-runs over the same text skip the API for chunks already answered
+        self.cache = ResponseCache('data/collins_openai_cache.db')
+
+    async def _json_completion(self, system_prompt: str, user_prompt: str, max_tokens: int) -> Dict[str, Any]:
+        """Run a JSON-mode chat completion, served from the response cache when possible"""
+        
+        model = self.openai_service.model
+        key = ResponseCache.make_key(model, system_prompt, user_prompt, max_tokens)
+        content = self.cache.get(key)
+        
+        if content is None:
+            await self.rate_limiter.acquire()
+            response = await self.client.chat.completions.create(
+                model=model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
+                ],
+                temperature=0.1,
+                max_tokens=max_tokens,
+                response_format={"type": "json_object"}
+            )
+            content = response.choices[0].message.content
+            result = json.loads(content)
+            # Only cache bodies that parsed, so a truncated reply is retried next run
+            self.cache.set(key, content)
+            return result
+        
+        return json.loads(content)
 
     async def extract_collins_entries_properly(self, text_chunk: str) -> List[Dict[str, Any]]:
         """Extract Collins entries with proper grammatical information"""
@@ -80,23 +213,12 @@ Focus on extracting real Collins dictionary entries, not generated content."""
 
         user_prompt = f"""Extract German dictionary entries from this Collins text:
 
-{text_chunk[:2000]}
+{text_chunk}
 
 Return JSON with proper grammatical information according to Collins format."""
 
         try:
-            response = await self.openai_service.client.chat.completions.create(
-                model=self.openai_service.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=0.1,
-                max_tokens=4000,
-                response_format={"type": "json_object"}
-            )
-            
-            result = json.loads(response.choices[0].message.content)
+            result = await self._json_completion(system_prompt, user_prompt, max_tokens=4000)
             return result.get('entries', [])
             
         except Exception as e:
@@ -106,88 +228,120 @@ Return JSON with proper grammatical information according to Collins format."""
     async def enhance_with_chinese(self, entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Add Chinese translations to entries"""
         
-        for entry in entries:
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        
+        async def enhance_entry(entry: Dict[str, Any]):
             try:
                 lemma = entry.get('lemma', '')
                 translations = entry.get('translations', [])
                 
                 if lemma and translations:
-                    # Generate Chinese translations
-                    chinese_translations = await self.generate_chinese_translations(lemma, translations)
+                    examples = [
+                        example for example in entry.get('examples', [])
+                        if example.get('de') and example.get('en')
+                    ]
+                    
+                    # One request covers the word and all of its examples
+                    async with semaphore:
+                        result = await self.generate_chinese_for_entry(lemma, translations, examples)
+                    
+                    chinese_translations = result.get('chinese', [])[:3]
                     if chinese_translations:
                         entry['chinese_translations'] = chinese_translations
                     
                     # Add Chinese to examples
-                    examples = entry.get('examples', [])
-                    for example in examples:
-                        if example.get('de') and example.get('en'):
-                            zh_text = await self.generate_chinese_example(example['de'], example['en'])
-                            if zh_text:
-                                example['zh'] = zh_text
-                
-                await asyncio.sleep(0.5)  # Rate limiting
+                    for example, zh_text in zip(examples, result.get('examples', [])):
+                        if zh_text:
+                            example['zh'] = zh_text
                 
             except Exception as e:
                 print(f"  Error adding Chinese for {entry.get('lemma', 'unknown')}: {e}")
-                continue
         
+        await asyncio.gather(*(enhance_entry(entry) for entry in entries))
         return entries
 
-    async def generate_chinese_translations(self, lemma: str, en_translations: List[str]) -> List[str]:
-        """Generate Chinese translations"""
+    async def generate_chinese_for_entry(
+        self, lemma: str, en_translations: List[str], examples: List[Dict[str, str]]
+    ) -> Dict[str, Any]:
+        """Generate Chinese translations for a word and its examples in one call"""
         
-        system_prompt = f"""Translate German word "{lemma}" to Chinese.
+        system_prompt = f"""Translate German word "{lemma}" to Chinese (2-3 words).
+Also translate each numbered German example sentence to Chinese, using the English as reference.
 
 English meanings: {', '.join(en_translations)}
 
-Return JSON: {{"chinese": ["中文1", "中文2"]}}"""
+Return JSON: {{"chinese": ["中文1", "中文2"], "examples": ["例句1的中文翻译", "例句2的中文翻译"]}}
+The "examples" array must have one Chinese sentence per example, in the same order."""
 
-        user_prompt = f'German: {lemma} → Chinese translations (2-3 words)'
+        example_lines = '\n'.join(
+            f"{i}. German: {example['de']} | English: {example['en']}"
+            for i, example in enumerate(examples, 1)
+        )
+        user_prompt = f'German: {lemma}\nExamples:\n{example_lines or "(none)"}'
 
         try:
-            response = await self.openai_service.client.chat.completions.create(
-                model=self.openai_service.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=0.1,
-                max_tokens=150,
-                response_format={"type": "json_object"}
+            return await self._json_completion(
+                system_prompt, user_prompt, max_tokens=150 + 100 * len(examples)
             )
             
-            result = json.loads(response.choices[0].message.content)
-            return result.get('chinese', [])[:3]
-            
         except Exception as e:
-            return []
+            return {}
 
-    async def generate_chinese_example(self, de_text: str, en_text: str) -> str:
-        """Generate Chinese example translation"""
+    def save_all_entries(self, entries: List[Dict[str, Any]]) -> int:
+        """Save entries on one connection in a single transaction, returns saved count"""
+        
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        saved_count = 0
         
-        system_prompt = """Translate German sentence to Chinese. Use English as reference.
-
-Return only the Chinese translation."""
-
-        user_prompt = f'German: {de_text}\nEnglish: {en_text}\nChinese:'
-
         try:
-            response = await self.openai_service.client.chat.completions.create(
-                model=self.openai_service.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=0.1,
-                max_tokens=100
-            )
-            
-            return response.choices[0].message.content.strip()
+            cursor.execute("BEGIN")
+            lemma_ids = self._prefetch_lemma_ids(cursor, entries)
+            for entry in entries:
+                # A savepoint per entry keeps one bad entry from undoing the batch
+                cursor.execute("SAVEPOINT entry")
+                try:
+                    saved = self.save_improved_entry(cursor, entry, lemma_ids)
+                except Exception as e:
+                    print(f"    Error saving {entry.get('lemma', 'unknown')}: {e}")
+                    cursor.execute("ROLLBACK TO entry")
+                    saved = False
+                cursor.execute("RELEASE entry")
+                if saved:
+                    saved_count += 1
             
-        except Exception as e:
-            return None
+            conn.commit()
+        finally:
+            conn.close()
+        
+        return saved_count
 
-    def save_improved_entry(self, entry: Dict[str, Any]) -> bool:
+    def _prefetch_lemma_ids(self, cursor: sqlite3.Cursor, entries: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Map lowercased lemma to existing id for every entry in the batch"""
+        
+        keys = list({
+            entry.get('lemma', '').strip().translate(_ASCII_LOWER)
+            for entry in entries
+            if entry.get('lemma', '').strip()
+        })
+        lemma_ids = {}
+        
+        for i in range(0, len(keys), LOOKUP_BATCH_SIZE):
+            batch = keys[i:i + LOOKUP_BATCH_SIZE]
+            placeholders = ','.join('?' * len(batch))
+            cursor.execute(f"""
+                SELECT id, LOWER(lemma) FROM word_lemmas
+                WHERE LOWER(lemma) IN ({placeholders})
+                ORDER BY id
+            """, batch)
+            for lemma_id, key in cursor.fetchall():
+                lemma_ids.setdefault(key, lemma_id)
+        
+        return lemma_ids
+
+    def save_improved_entry(
+        self, cursor: sqlite3.Cursor, entry: Dict[str, Any], lemma_ids: Dict[str, int]
+    ) -> bool:
         """Save entry with improved Collins grammatical information"""
         
         lemma = entry.get('lemma', '').strip()
@@ -196,110 +350,102 @@ Return only the Chinese translation."""
         if not lemma:
             return False
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        # Check if exists
+        key = lemma.translate(_ASCII_LOWER)
+        lemma_id = lemma_ids.get(key)
         
-        try:
-            # Check if exists
-            cursor.execute("SELECT id FROM word_lemmas WHERE LOWER(lemma) = LOWER(?)", (lemma,))
-            existing = cursor.fetchone()
+        if lemma_id is not None:
+            print(f"    Updating: {lemma}")
+            # Clear existing data
+            cursor.execute("DELETE FROM word_forms WHERE lemma_id = ?", (lemma_id,))
+            cursor.execute("DELETE FROM examples WHERE lemma_id = ?", (lemma_id,))
+            cursor.execute("DELETE FROM translations WHERE lemma_id = ? AND source LIKE '%collins%'", (lemma_id,))
+        else:
+            print(f"    Inserting: {lemma}")
+            # Insert new lemma
+            ipa = entry['ipa'].translate(_BRACKET_TRANS) if entry.get('ipa') else None
+            cursor.execute("""
+                INSERT INTO word_lemmas (lemma, pos, ipa, cefr, notes, created_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, (lemma, pos, ipa, 'A1', 'Collins Dictionary - Improved', datetime.now().isoformat()))
+            lemma_id = cursor.lastrowid
+        
+        # Insert English and Chinese translations, dropping repeats the model
+        # emitted before applying the limits so they keep distinct meanings
+        en_translations = list(dict.fromkeys(t for t in entry.get('translations', []) if t))
+        zh_translations = list(dict.fromkeys(t for t in entry.get('chinese_translations', []) if t))
+        translation_rows = [
+            (lemma_id, 'en', translation, 'collins_improved')
+            for translation in en_translations[:5]
+        ] + [
+            (lemma_id, 'zh', zh_translation, 'collins_chinese')
+            for zh_translation in zh_translations[:3]
+        ]
+        cursor.executemany("""
+            INSERT INTO translations (lemma_id, lang_code, text, source)
+            VALUES (?, ?, ?, ?)
+        """, translation_rows)
+        
+        # Insert examples, one per distinct German sentence
+        examples = {}
+        for example in entry.get('examples', []):
+            if example.get('de') and example.get('en'):
+                examples.setdefault(example['de'], example)
+        cursor.executemany("""
+            INSERT INTO examples (lemma_id, de_text, en_text, zh_text, level)
+            VALUES (?, ?, ?, ?, ?)
+        """, [
+            (lemma_id, example['de'], example['en'], example.get('zh'), 'A1')
+            for example in list(examples.values())[:2]
+        ])
+        
+        # Handle noun-specific Collins data
+        if pos == 'noun':
+            form_rows = []
             
-            if existing:
-                lemma_id = existing[0]
-                print(f"    Updating: {lemma}")
-                # Clear existing data
-                cursor.execute("DELETE FROM word_forms WHERE lemma_id = ?", (lemma_id,))
-                cursor.execute("DELETE FROM examples WHERE lemma_id = ?", (lemma_id,))
-                cursor.execute("DELETE FROM translations WHERE lemma_id = ? AND source LIKE '%collins%'", (lemma_id,))
-            else:
-                print(f"    Inserting: {lemma}")
-                # Insert new lemma
-                ipa = entry.get('ipa', '').replace('[', '').replace(']', '') if entry.get('ipa') else None
-                cursor.execute("""
-                    INSERT INTO word_lemmas (lemma, pos, ipa, cefr, notes, created_at)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """, (lemma, pos, ipa, 'A1', 'Collins Dictionary - Improved', datetime.now().isoformat()))
-                lemma_id = cursor.lastrowid
+            gender = entry.get('gender', '')
+            if gender in ['m', 'f', 'nt']:
+                article = {'m': 'der', 'f': 'die', 'nt': 'das'}[gender]
+                form_rows.append((lemma_id, article, 'article', 'article'))
             
-            # Insert English translations
-            for translation in entry.get('translations', [])[:5]:
-                if translation:
-                    cursor.execute("""
-                        INSERT INTO translations (lemma_id, lang_code, text, source)
-                        VALUES (?, ?, ?, ?)
-                    """, (lemma_id, 'en', translation, 'collins_improved'))
+            # Plural handling
+            plural = entry.get('plural', '')
+            countability = entry.get('countability', 'countable')
             
-            # Insert Chinese translations
-            for zh_translation in entry.get('chinese_translations', [])[:3]:
-                if zh_translation:
-                    cursor.execute("""
-                        INSERT INTO translations (lemma_id, lang_code, text, source)
-                        VALUES (?, ?, ?, ?)
-                    """, (lemma_id, 'zh', zh_translation, 'collins_chinese'))
+            if plural and plural != 'no pl' and countability != 'uncountable':
+                form_rows.append((lemma_id, plural, 'plural', 'plural'))
             
-            # Insert examples
-            for example in entry.get('examples', [])[:2]:
-                if example.get('de') and example.get('en'):
-                    cursor.execute("""
-                        INSERT INTO examples (lemma_id, de_text, en_text, zh_text, level)
-                        VALUES (?, ?, ?, ?, ?)
-                    """, (lemma_id, example['de'], example['en'], example.get('zh'), 'A1'))
+            # Genitive if available
+            genitive = entry.get('genitive', '')
+            if genitive and genitive != '-':
+                genitive_form = lemma + genitive.replace('-(', '').replace(')', '')  # Simplified
+                form_rows.append((lemma_id, genitive_form, 'genitive', 'genitive_singular'))
             
-            # Handle noun-specific Collins data
-            if pos == 'noun':
-                gender = entry.get('gender', '')
-                if gender in ['m', 'f', 'nt']:
-                    article = {'m': 'der', 'f': 'die', 'nt': 'das'}[gender]
-                    cursor.execute("""
-                        INSERT INTO word_forms (lemma_id, form, feature_key, feature_value)
-                        VALUES (?, ?, ?, ?)
-                    """, (lemma_id, article, 'article', 'article'))
-                
-                # Plural handling
-                plural = entry.get('plural', '')
-                countability = entry.get('countability', 'countable')
-                
-                if plural and plural != 'no pl' and countability != 'uncountable':
-                    cursor.execute("""
-                        INSERT INTO word_forms (lemma_id, form, feature_key, feature_value)
-                        VALUES (?, ?, ?, ?)
-                    """, (lemma_id, plural, 'plural', 'plural'))
-                
-                # Genitive if available
-                genitive = entry.get('genitive', '')
-                if genitive and genitive != '-':
-                    genitive_form = lemma + genitive.replace('-(', '').replace(')', '')  # Simplified
-                    cursor.execute("""
-                        INSERT INTO word_forms (lemma_id, form, feature_key, feature_value)
-                        VALUES (?, ?, ?, ?)
-                    """, (lemma_id, genitive_form, 'genitive', 'genitive_singular'))
-            
-            # Handle verb-specific Collins data
-            elif pos == 'verb':
-                transitivity = entry.get('transitivity', '')
-                separable = entry.get('separable', False)
-                preposition = entry.get('preposition', '')
-                
-                # Save verb properties in notes
-                verb_info = {
-                    'transitivity': transitivity,
-                    'separable': separable,
-                    'preposition': preposition
-                }
-                cursor.execute("""
-                    UPDATE word_lemmas SET notes = notes || ' | verb_info: ' || ?
-                    WHERE id = ?
-                """, (json.dumps(verb_info), lemma_id))
-            
-            conn.commit()
-            conn.close()
-            return True
+            cursor.executemany("""
+                INSERT INTO word_forms (lemma_id, form, feature_key, feature_value)
+                VALUES (?, ?, ?, ?)
+            """, form_rows)
+        
+        # Handle verb-specific Collins data
+        elif pos == 'verb':
+            transitivity = entry.get('transitivity', '')
+            separable = entry.get('separable', False)
+            preposition = entry.get('preposition', '')
             
-        except Exception as e:
-            print(f"    Error saving {lemma}: {e}")
-            conn.rollback()
-            conn.close()
-            return False
+            # Save verb properties in notes
+            verb_info = {
+                'transitivity': transitivity,
+                'separable': separable,
+                'preposition': preposition
+            }
+            cursor.execute("""
+                UPDATE word_lemmas SET notes = notes || ' | verb_info: ' || ?
+                WHERE id = ?
+            """, (json.dumps(verb_info), lemma_id))
+        
+        # Recorded last so a rolled-back entry leaves no stale id behind
+        lemma_ids[key] = lemma_id
+        return True
 
 
 async def main():
@@ -323,36 +469,36 @@ async def main():
     
     extractor = ImprovedCollinsExtractor()
     
-    # Load text
-    with open("full_dictionary.txt", 'r', encoding='utf-8') as f:
-        text = f.read()
-    
-    # Process in chunks
-    chunk_size = 8000
-    chunks = [text[i:i+chunk_size] for i in range(0, len(text), chunk_size)]
-    
-    print(f"Total text length: {len(text)} characters")
-    print(f"Created {len(chunks)} chunks with size {chunk_size}")
+    # Stream the text in chunks; limited modes stop reading after their chunks
+    # Sized to what one extraction prompt covers; chunks are no longer truncated
+    chunk_size = 2000
+    chunks = iter_text_chunks("full_dictionary.txt", chunk_size)
     
     if args.test:
-        chunks_to_process = chunks[:2]
+        chunks_to_process = list(islice(chunks, 2))
         print("TEST MODE: Processing first 2 chunks")
     elif args.process_all:
-        chunks_to_process = chunks
-        print(f"FULL MODE: Processing all {len(chunks)} chunks")
+        chunks_to_process = list(chunks)
+        print(f"FULL MODE: Processing all {len(chunks_to_process)} chunks")
     else:
-        chunks_to_process = chunks[:3]
+        chunks_to_process = list(islice(chunks, 3))
         print("DEFAULT MODE: Processing first 3 chunks")
     
-    all_entries = []
+    print(f"Read {sum(map(len, chunks_to_process))} characters in chunks of size {chunk_size}")
+    
+    # Extract entries concurrently, capping in-flight OpenAI requests
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
     
-    # Extract entries
-    for i, chunk in enumerate(chunks_to_process):
-        print(f"Extracting from chunk {i+1}/{len(chunks_to_process)}...")
-        entries = await extractor.extract_collins_entries_properly(chunk)
-        print(f"  Found {len(entries)} entries")
-        all_entries.extend(entries)
-        await asyncio.sleep(1)
+    async def extract_chunk(i: int, chunk: str) -> List[Dict[str, Any]]:
+        async with semaphore:
+            entries = await extractor.extract_collins_entries_properly(chunk)
+        print(f"Chunk {i+1}/{len(chunks_to_process)}: found {len(entries)} entries")
+        return entries
+    
+    chunk_results = await asyncio.gather(
+        *(extract_chunk(i, chunk) for i, chunk in enumerate(chunks_to_process))
+    )
+    all_entries = [entry for entries in chunk_results for entry in entries]
     
     if not all_entries:
         print("No entries found!")
@@ -362,12 +508,7 @@ async def main():
     enhanced_entries = await extractor.enhance_with_chinese(all_entries)
     
     print(f"\nSaving to database...")
-    saved_count = 0
-    
-    for entry in enhanced_entries:
-        if extractor.save_improved_entry(entry):
-            saved_count += 1
-        await asyncio.sleep(0.5)
+    saved_count = extractor.save_all_entries(enhanced_entries)
     
     print(f"\n=== COMPLETED ===")
     print(f"Extracted: {len(all_entries)} entries")
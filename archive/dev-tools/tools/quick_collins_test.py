@@ -14,13 +14,6 @@ from dotenv import load_dotenv
 load_dotenv(".env")
 sys.path.append(os.getcwd())
 
-try:
-    from PyPDF2 import PdfReader
-except ImportError:
-    import subprocess
-    subprocess.run(["pip", "install", "PyPDF2"], check=True)
-    from PyPDF2 import PdfReader
-
 from app.services.openai_service import OpenAIService
 
 
@@ -32,6 +25,12 @@ async def quick_test(pdf_file: str):
     
     # Step 1: Read PDF
     print("\n1. Reading PDF...")
+    try:
+        from PyPDF2 import PdfReader  # only needed once a run actually starts
+    except ImportError:
+        print("✗ PyPDF2 not found. Install with: uv add pypdf2")
+        return
+    
     try:
         reader = PdfReader(pdf_file)
         print(f"✓ Pages: {len(reader.pages)}")
@@ -6,14 +6,13 @@ Default: 50 pages per output file
 """
 import argparse
 import os
+import sys
 from pathlib import Path
 try:
     from PyPDF2 import PdfReader, PdfWriter
 except ImportError:
-    print("PyPDF2 not found. Installing...")
-    import subprocess
-    subprocess.run(["pip", "install", "PyPDF2"], check=True)
-    from PyPDF2 import PdfReader, PdfWriter
+    print("PyPDF2 not found. Install with: uv add pypdf2")
+    sys.exit(1)
 
 
 class PDFSplitter:
@@ -23,6 +23,11 @@ except ImportError:
     print("❌ 需要安装PyPDF2库: pip install PyPDF2")
     sys.exit(1)
 
+try:
+    import pypdfium2 as pdfium  # 可选：原生PDF解析，比PyPDF2快很多
+except ImportError:
+    pdfium = None
+
 from app.services.lexicon_llm_service import LexiconLLMService
 
 class PDFVocabularyExtractor:
@@ -38,17 +43,19 @@ class PDFVocabularyExtractor:
     
     def extract_text_from_pdf(self, pdf_path: str) -> str:
         """从PDF文件提取文本"""
+        if pdfium is not None:
+            return self._extract_text_with_pdfium(pdf_path)
+        
         try:
             with open(pdf_path, 'rb') as file:
                 pdf_reader = PyPDF2.PdfReader(file)
-                text = ""
+                page_texts = []
                 
                 print(f"📖 PDF共有 {len(pdf_reader.pages)} 页")
                 
                 for page_num, page in enumerate(pdf_reader.pages):
                     try:
-                        page_text = page.extract_text()
-                        text += page_text + "\n"
+                        page_texts.append(page.extract_text() + "\n")
                         
                         if page_num % 10 == 0:
                             print(f"   已处理 {page_num + 1} 页...")
@@ -57,12 +64,43 @@ class PDFVocabularyExtractor:
                         print(f"   ⚠️ 第 {page_num + 1} 页提取失败: {e}")
                         continue
                 
-                return text
+                return "".join(page_texts)
                 
         except Exception as e:
             print(f"❌ 读取PDF失败: {e}")
             return ""
     
+    def _extract_text_with_pdfium(self, pdf_path: str) -> str:
+        """使用pypdfium2从PDF文件提取文本"""
+        try:
+            pdf = pdfium.PdfDocument(pdf_path)
+        except Exception as e:
+            print(f"❌ 读取PDF失败: {e}")
+            return ""
+        
+        try:
+            print(f"📖 PDF共有 {len(pdf)} 页")
+            page_texts = []
+            
+            for page_num in range(len(pdf)):
+                try:
+                    page = pdf[page_num]
+                    textpage = page.get_textpage()
+                    page_texts.append(textpage.get_text_range() + "\n")
+                    textpage.close()
+                    page.close()
+                    
+                    if page_num % 10 == 0:
+                        print(f"   已处理 {page_num + 1} 页...")
+                        
+                except Exception as e:
+                    print(f"   ⚠️ 第 {page_num + 1} 页提取失败: {e}")
+                    continue
+            
+            return "".join(page_texts)
+        finally:
+            pdf.close()
+    
     async def extract_german_words_with_ai(self, text: str, chunk_size: int = 2000) -> Set[str]:
         """使用AI从文本中智能提取德语单词"""
         words = set()
@@ -33,7 +33,8 @@ async def run_quick_functionality_test():
         if not test_user:
             test_user = User(
                 email="quicktest@example.com",
-                password_hash=get_password_hash("test123"),
+                # 允许通过TEST_PWHASH传入预先计算的哈希，跳过bcrypt开销
+                password_hash=os.environ.get("TEST_PWHASH") or get_password_hash("test123"),
                 role=UserRole.USER
             )
             db.add(test_user)
@@ -139,7 +140,7 @@ def run_database_integrity_test():
         db.close()
 
 
-def run_openai_integration_test():
+async def run_openai_integration_test_async():
     """OpenAI集成测试"""
     
     print("\n🤖 OpenAI集成测试")
@@ -154,26 +155,28 @@ def run_openai_integration_test():
     
     openai_service = OpenAIService()
     
-    async def _test():
-        try:
-            # 测试简单词汇分析
-            result = await openai_service.analyze_word("Test")
-            
-            if result and result.get("pos"):
-                print("✅ OpenAI词汇分析工作正常")
-                print(f"   测试词: Test")
-                print(f"   词性: {result.get('pos')}")
-                print(f"   英文翻译: {result.get('translations_en', [])}")
-                return True
-            else:
-                print("❌ OpenAI词汇分析返回无效结果")
-                return False
-                
-        except Exception as e:
-            print(f"❌ OpenAI集成测试失败: {e}")
+    try:
+        # 测试简单词汇分析
+        result = await openai_service.analyze_word("Test")
+        
+        if result and result.get("pos"):
+            print("✅ OpenAI词汇分析工作正常")
+            print(f"   测试词: Test")
+            print(f"   词性: {result.get('pos')}")
+            print(f"   英文翻译: {result.get('translations_en', [])}")
+            return True
+        else:
+            print("❌ OpenAI词汇分析返回无效结果")
             return False
-    
-    return asyncio.run(_test())
+            
+    except Exception as e:
+        print(f"❌ OpenAI集成测试失败: {e}")
+        return False
+
+
+def run_openai_integration_test():
+    """OpenAI集成测试（同步入口）"""
+    return asyncio.run(run_openai_integration_test_async())
 
 
 async def run_comprehensive_tests():
@@ -187,8 +190,8 @@ async def run_comprehensive_tests():
     # 1. 数据库完整性测试
     db_ok = run_database_integrity_test()
     
-    # 2. OpenAI集成测试
-    openai_ok = run_openai_integration_test()
+    # 2. OpenAI集成测试（与后续步骤顺序执行，避免输出交错和计时互相干扰）
+    openai_ok = await run_openai_integration_test_async()
     
     # 3. 快速功能测试
     await run_quick_functionality_test()
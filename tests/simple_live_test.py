@@ -25,8 +25,8 @@ def test_api_response_format():
             # 模拟enhanced_vocabulary_service的查询逻辑
             cursor.execute("""
                 SELECT wl.id, wl.lemma, wl.pos,
-                       GROUP_CONCAT(CASE WHEN t.lang_code = 'en' THEN t.text END) as translations_en,
-                       GROUP_CONCAT(CASE WHEN t.lang_code = 'zh' THEN t.text END) as translations_zh,
+                       GROUP_CONCAT(DISTINCT CASE WHEN t.lang_code = 'en' THEN t.text END) as translations_en,
+                       GROUP_CONCAT(DISTINCT CASE WHEN t.lang_code = 'zh' THEN t.text END) as translations_zh,
                        e.de_text, e.en_text, e.zh_text
                 FROM word_lemmas wl
                 LEFT JOIN translations t ON t.lemma_id = wl.id
@@ -91,20 +91,18 @@ def test_api_response_format():
         # 测试整体状态
         print(f"\n📊 整体状态检查:")
         
+        # 一次查询同时统计翻译和例句
         cursor.execute("""
-            SELECT COUNT(*) FROM word_lemmas wl
-            INNER JOIN translations t ON t.lemma_id = wl.id
-            WHERE wl.lemma IN ('bezahlen', 'Kreuzen')
+            SELECT
+                (SELECT COUNT(*) FROM word_lemmas wl
+                 INNER JOIN translations t ON t.lemma_id = wl.id
+                 WHERE wl.lemma IN ('bezahlen', 'Kreuzen')),
+                (SELECT COUNT(*) FROM word_lemmas wl
+                 INNER JOIN examples e ON e.lemma_id = wl.id
+                 WHERE wl.lemma IN ('bezahlen', 'Kreuzen')
+                   AND e.de_text IS NOT NULL)
         """)
-        words_with_translations = cursor.fetchone()[0]
-        
-        cursor.execute("""
-            SELECT COUNT(*) FROM word_lemmas wl
-            INNER JOIN examples e ON e.lemma_id = wl.id
-            WHERE wl.lemma IN ('bezahlen', 'Kreuzen')
-              AND e.de_text IS NOT NULL
-        """)
-        words_with_examples = cursor.fetchone()[0]
+        words_with_translations, words_with_examples = cursor.fetchone()
         
         print(f"   关键词汇有翻译: {words_with_translations}/2")
         print(f"   关键词汇有例句: {words_with_examples}/2")